@@ -14,16 +14,37 @@ python token_estimator.py /path/to/your/project
 # Specify custom token limit
 python token_estimator.py /path/to/your/project --limit 100000
 
+# Scan directories serially instead of on a thread pool
+python token_estimator.py /path/to/your/project --jobs 1
+
 # Set maximum file size to process (default is 10MB)
 python token_estimator.py /path/to/your/project --max-file-size 5
+
+# Correct the byte-size estimate for multi-byte UTF-8 by sampling 4KB per file
+python token_estimator.py /path/to/your/project --sample-mode sample --sample-bytes 4096
+
+# Read every file for exact character counts (slowest)
+python token_estimator.py /path/to/your/project --sample-mode full
+
+# Stop walking as soon as the tree is clearly over the limit
+python token_estimator.py /path/to/your/project --fail-fast
+
+# Reuse character counts of unchanged files from the previous full read
+python token_estimator.py /path/to/your/project --sample-mode full --cache
 """
 
 
 import os
 import sys
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from functools import partial
 import argparse
+import hashlib
+import heapq
+import io
+import pickle
 
 # Token estimation multipliers by file extension
 TOKEN_MULTIPLIERS = {
@@ -56,46 +77,195 @@ TOKEN_MULTIPLIERS = {
 }
 
 # Common directories to skip
-SKIP_DIRS = {
+SKIP_DIRS = frozenset({
     '.git', '__pycache__', 'node_modules', '.idea', '.vscode', 
     'venv', 'env', '.env', 'dist', 'build', 'target', '.next',
     'coverage', '.pytest_cache', '.mypy_cache', 'vendor'
-}
+})
 
-# Binary file extensions to skip
-SKIP_EXTENSIONS = {
+# Binary file extensions to skip (lowercase, compared against lowercased suffixes)
+SKIP_EXTENSIONS = frozenset({
     '.pyc', '.pyo', '.so', '.dll', '.dylib', '.exe', '.bin',
     '.jpg', '.jpeg', '.png', '.gif', '.ico', '.svg', '.webp',
     '.mp3', '.mp4', '.avi', '.mov', '.wav', '.flac',
     '.zip', '.tar', '.gz', '.rar', '.7z',
     '.pdf', '.doc', '.docx', '.xls', '.xlsx',
     '.db', '.sqlite', '.sqlite3'
-}
+})
+
+# Tokens per character, precomputed from TOKEN_MULTIPLIERS
+# (multiplier tokens per line, ~80 chars per line)
+_TOKENS_PER_CHAR = {ext: mult / 80 for ext, mult in TOKEN_MULTIPLIERS.items()}
+
+# Default rate: 1 token ≈ 3.5 characters with 1.2x multiplier for safety
+_DEFAULT_RATE = 1.2 / 3.5
+
+# Read size for full-mode character counting
+READ_CHUNK_SIZE = 128 * 1024
+
+# UTF-8 continuation bytes (0b10xxxxxx); every other byte starts a character
+_UTF8_CONTINUATION_BYTES = bytes(range(0x80, 0xC0))
 
-def estimate_tokens(char_count, file_extension=None):
-    """Estimate token count from character count."""
-    # Base estimation: 1 token ≈ 3.5 characters
-    base_tokens = char_count / 3.5
+# With --fail-fast, the walk stops once the estimate passes limit * this factor
+FAIL_FAST_FACTOR = 1.5
+
+# Number of largest files kept for the report
+LARGEST_FILES_KEPT = 20
+
+def sample_char_ratio(file_path, sample_bytes):
+    """Estimate characters per byte by decoding the first sample_bytes of a file."""
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        sample = os.read(fd, sample_bytes)
+    finally:
+        os.close(fd)
     
-    # Apply language-specific multiplier if available
-    if file_extension and file_extension.lower() in TOKEN_MULTIPLIERS:
-        lines = char_count / 80  # Rough estimate of lines (80 chars per line)
-        return int(lines * TOKEN_MULTIPLIERS[file_extension.lower()])
+    if not sample:
+        return 1.0
+    return len(sample.decode('utf-8', errors='ignore')) / len(sample)
+
+def count_chars(file_path):
+    """Count UTF-8 characters by reading the file in raw binary chunks.
     
-    # Default estimation with 1.2x multiplier for safety
-    return int(base_tokens * 1.2)
+    Counts bytes that start a character instead of decoding, so no str is
+    ever built. Chunk boundaries don't matter since each byte is classified
+    on its own.
+    """
+    char_count = 0
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        while chunk := os.read(fd, READ_CHUNK_SIZE):
+            char_count += len(chunk.translate(None, _UTF8_CONTINUATION_BYTES))
+    finally:
+        os.close(fd)
+    return char_count
 
-def should_skip_file(file_path):
-    """Check if file should be skipped."""
-    # Skip hidden files
-    if file_path.name.startswith('.'):
-        return True
+def _scan_dir(dir_path, max_size_bytes, sample_mode='size', sample_bytes=4096,
+              char_cache=None, new_char_cache=None):
+    """Scan a single directory.
     
-    # Skip binary files
-    if file_path.suffix.lower() in SKIP_EXTENSIONS:
-        return True
+    Returns (subdirs, files, skipped, large_files, errors) where files is a
+    list of (path, size, char_count, ext_lower) tuples. If new_char_cache is
+    given, sampled or read character counts are recorded in it as
+    path -> (size, mtime_ns, char_count), and counts in char_cache are
+    reused while a file's size and mtime are unchanged.
+    """
+    subdirs, files, large_files, errors = [], [], [], []
+    skipped = 0
     
-    return False
+    try:
+        it = os.scandir(dir_path)
+    except OSError:
+        # Unreadable directory, os.walk() ignores these too
+        return subdirs, files, skipped, large_files, errors
+    
+    with it:
+        while True:
+            # A listing error part way through ends this directory's scan
+            # with what was collected so far, as os.walk() does
+            try:
+                entry = next(it)
+            except (StopIteration, OSError):
+                break
+            
+            name = entry.name
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if name not in SKIP_DIRS:
+                        subdirs.append(entry.path)
+                    continue
+            except OSError:
+                continue
+            
+            # Skip hidden and binary files by name alone, before is_file()
+            # or stat() can cost a syscall
+            if name.startswith('.'):
+                skipped += 1
+                continue
+            
+            dot = name.rfind('.')
+            # Like Path.suffix: no suffix for a leading or trailing dot
+            ext_lower = name[dot:].lower() if 0 < dot < len(name) - 1 else ''
+            if ext_lower in SKIP_EXTENSIONS:
+                skipped += 1
+                continue
+            
+            try:
+                if not entry.is_file():
+                    # Links to directories are never descended into, as with
+                    # os.walk(); dangling links are read errors and other
+                    # special files (sockets, FIFOs, devices) are skipped
+                    if entry.is_dir():
+                        continue
+                    entry.stat()
+                    skipped += 1
+                    continue
+            except OSError as e:
+                errors.append((entry.path, e))
+                continue
+            
+            try:
+                # Check file size (cached on the DirEntry where the OS allows)
+                st = entry.stat()
+                file_size = st.st_size
+                if file_size > max_size_bytes:
+                    skipped += 1
+                    large_files.append((entry.path, file_size))
+                    continue
+                
+                # Only the sample and full modes open the file; by default
+                # the size stands in for the character count
+                if sample_mode == 'size' or file_size == 0:
+                    char_count = file_size
+                else:
+                    cached = char_cache.get(entry.path) if char_cache else None
+                    if cached and cached[0] == file_size and cached[1] == st.st_mtime_ns:
+                        char_count = cached[2]
+                    elif sample_mode == 'sample':
+                        char_count = int(file_size * sample_char_ratio(entry.path, sample_bytes))
+                    else:
+                        char_count = count_chars(entry.path)
+                    if new_char_cache is not None:
+                        new_char_cache[entry.path] = (file_size, st.st_mtime_ns, char_count)
+            except Exception as e:
+                errors.append((entry.path, e))
+                continue
+            
+            files.append((entry.path, file_size, char_count, ext_lower))
+    
+    return subdirs, files, skipped, large_files, errors
+
+def _walk(root, scan, jobs=1):
+    """Yield scan() results for root and every subdirectory it reports.
+    
+    With jobs > 1 directories are scanned on a thread pool. At most
+    jobs * 2 scans are in flight at once so deep trees don't queue
+    unbounded work.
+    """
+    if jobs <= 1:
+        stack = [root]
+        while stack:
+            result = scan(stack.pop())
+            stack.extend(result[0])
+            yield result
+        return
+    
+    pending = [root]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        in_flight = set()
+        try:
+            while pending or in_flight:
+                while pending and len(in_flight) < jobs * 2:
+                    in_flight.add(executor.submit(scan, pending.pop()))
+                done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    pending.extend(result[0])
+                    yield result
+        finally:
+            # Drop queued scans if the consumer stopped early
+            for future in in_flight:
+                future.cancel()
 
 def format_size(size_bytes):
     """Format byte size to human readable format."""
@@ -105,8 +275,41 @@ def format_size(size_bytes):
         size_bytes /= 1024.0
     return f"{size_bytes:.1f} TB"
 
-def analyze_directory(directory_path, max_file_size_mb=10):
-    """Analyze all files in directory and estimate tokens."""
+def _cache_file(root, sample_mode, sample_bytes):
+    """Return the character-count cache path for one root and sampling setup."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    # The sample size only affects counts in sample mode
+    setup = f"{sample_mode}|{sample_bytes}" if sample_mode == 'sample' else sample_mode
+    key = hashlib.blake2b(
+        f"{root}|{setup}".encode(),
+        digest_size=16
+    ).hexdigest()
+    return Path(cache_home) / 'token-estimator' / f"{key}.pickle"
+
+def load_char_cache(cache_file):
+    """Load cached character counts, or an empty dict if missing or unreadable."""
+    try:
+        return pickle.loads(cache_file.read_bytes())
+    except Exception:
+        return {}
+
+def save_char_cache(cache_file, char_cache):
+    """Atomically write char_cache to cache_file; failures only print a warning."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        tmp_file.write_bytes(pickle.dumps(char_cache, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"Warning: could not write cache {cache_file}: {e}")
+
+def analyze_directory(directory_path, max_file_size_mb=10, sample_mode='size', sample_bytes=4096, jobs=1,
+                      use_cache=False, refresh_cache=False, stop_above_tokens=None):
+    """Analyze all files in directory and estimate tokens.
+    
+    If stop_above_tokens is set, the walk stops as soon as the running
+    estimate exceeds it and the returned stats are marked partial_scan.
+    """
     directory = Path(directory_path)
     
     if not directory.exists():
@@ -117,78 +320,96 @@ def analyze_directory(directory_path, max_file_size_mb=10):
         print(f"Error: '{directory}' is not a directory.")
         return
     
-    stats = {
-        'total_chars': 0,
-        'total_tokens': 0,
-        'total_files': 0,
-        'skipped_files': 0,
-        'errors': 0,
-        'by_extension': defaultdict(lambda: {'files': 0, 'chars': 0, 'tokens': 0}),
-        'largest_files': []
-    }
-    
     max_size_bytes = max_file_size_mb * 1024 * 1024
     
     print(f"Analyzing directory: {directory.absolute()}")
     print(f"Skipping files larger than {max_file_size_mb}MB")
     print("-" * 80)
     
-    # Walk through directory
-    for root, dirs, files in os.walk(directory):
-        # Skip certain directories
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+    # Walk from the absolute root so every scanned path starts with
+    # root_prefix and relative paths are a plain string slice
+    root = str(directory.absolute())
+    root_prefix_len = len(os.path.join(root, ''))
+    
+    # The tree is always walked; only sampled or fully read character counts
+    # are cached, per file, and each is checked against the file's current
+    # size and mtime. Size mode has nothing worth caching.
+    cache_file = char_cache = new_char_cache = None
+    if (use_cache or refresh_cache) and sample_mode != 'size':
+        cache_file = _cache_file(root, sample_mode, sample_bytes)
+        char_cache = {} if refresh_cache else load_char_cache(cache_file)
+        new_char_cache = {}
+        if char_cache:
+            print(f"Reusing character counts of unchanged files from {cache_file}")
+    
+    # Accumulate into locals and build stats once the walk is done
+    total_chars = total_tokens = total_files = skipped_files = error_count = 0
+    files_by_ext, chars_by_ext, tokens_by_ext = Counter(), Counter(), Counter()
+    largest_files = []
+    partial_scan = False
+    rate_for = _TOKENS_PER_CHAR.get
+    
+    # Walk through directory, aggregating each scanned directory's files
+    scan = partial(_scan_dir, max_size_bytes=max_size_bytes,
+                   sample_mode=sample_mode, sample_bytes=sample_bytes,
+                   char_cache=char_cache, new_char_cache=new_char_cache)
+    for _, files, skipped, large_files, errors in _walk(root, scan, jobs):
+        skipped_files += skipped
+        error_count += len(errors)
+        
+        for file_path, file_size in large_files:
+            print(f"Skipping large file: {file_path[root_prefix_len:]} ({format_size(file_size)})")
         
-        root_path = Path(root)
+        for file_path, e in errors:
+            print(f"Error reading {file_path[root_prefix_len:]}: {e}")
         
-        for file_name in files:
-            file_path = root_path / file_name
+        for file_path, file_size, char_count, ext_lower in files:
+            # Estimate tokens
+            tokens = int(char_count * rate_for(ext_lower, _DEFAULT_RATE))
             
-            if should_skip_file(file_path):
-                stats['skipped_files'] += 1
-                continue
+            # Update statistics
+            total_chars += char_count
+            total_tokens += tokens
+            total_files += 1
             
-            try:
-                # Check file size
-                file_size = file_path.stat().st_size
-                if file_size > max_size_bytes:
-                    stats['skipped_files'] += 1
-                    print(f"Skipping large file: {file_path.relative_to(directory)} ({format_size(file_size)})")
-                    continue
-                
-                # Read file content
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    char_count = len(content)
-                    
-                    # Estimate tokens
-                    tokens = estimate_tokens(char_count, file_path.suffix)
-                    
-                    # Update statistics
-                    stats['total_chars'] += char_count
-                    stats['total_tokens'] += tokens
-                    stats['total_files'] += 1
-                    
-                    ext_stats = stats['by_extension'][file_path.suffix.lower() or '.no_ext']
-                    ext_stats['files'] += 1
-                    ext_stats['chars'] += char_count
-                    ext_stats['tokens'] += tokens
-                    
-                    # Track largest files
-                    relative_path = file_path.relative_to(directory)
-                    stats['largest_files'].append({
-                        'path': str(relative_path),
-                        'chars': char_count,
-                        'tokens': tokens,
-                        'size': file_size
-                    })
-                    
-            except Exception as e:
-                stats['errors'] += 1
-                print(f"Error reading {file_path.relative_to(directory)}: {e}")
+            ext_key = ext_lower or '.no_ext'
+            files_by_ext[ext_key] += 1
+            chars_by_ext[ext_key] += char_count
+            tokens_by_ext[ext_key] += tokens
+            
+            # Track largest files in a min-heap of (tokens, size, path)
+            if len(largest_files) < LARGEST_FILES_KEPT:
+                heapq.heappush(largest_files, (tokens, file_size, file_path[root_prefix_len:]))
+            elif tokens > largest_files[0][0]:
+                heapq.heapreplace(largest_files, (tokens, file_size, file_path[root_prefix_len:]))
+            
+            if stop_above_tokens is not None and total_tokens > stop_above_tokens:
+                partial_scan = True
+                break
+        
+        if partial_scan:
+            break
     
-    # Sort largest files by token count
-    stats['largest_files'].sort(key=lambda x: x['tokens'], reverse=True)
-    stats['largest_files'] = stats['largest_files'][:20]  # Keep top 20
+    stats = {
+        'total_chars': total_chars,
+        'total_tokens': total_tokens,
+        'total_files': total_files,
+        'skipped_files': skipped_files,
+        'errors': error_count,
+        'files_by_ext': files_by_ext,
+        'chars_by_ext': chars_by_ext,
+        'tokens_by_ext': tokens_by_ext,
+        'largest_files': largest_files,
+        'partial_scan': partial_scan
+    }
+    
+    # Entries for files that no longer exist are dropped, unless the scan
+    # stopped early and never got to see them
+    if cache_file:
+        if partial_scan:
+            char_cache.update(new_char_cache)
+            new_char_cache = char_cache
+        save_char_cache(cache_file, new_char_cache)
     
     return stats
 
@@ -197,57 +418,60 @@ def print_report(stats, token_limit=200000):
     if not stats:
         return
     
-    print("\n" + "=" * 80)
-    print("ANALYSIS SUMMARY")
-    print("=" * 80)
+    # Build the whole report and emit it with a single write
+    buf = io.StringIO()
+    w = buf.write
+    
+    w("\n" + "=" * 80 + "\n")
+    w("ANALYSIS SUMMARY\n")
+    w("=" * 80 + "\n")
     
-    print(f"\nTotal files analyzed: {stats['total_files']:,}")
-    print(f"Files skipped: {stats['skipped_files']:,}")
-    print(f"Errors encountered: {stats['errors']:,}")
+    w(f"\nTotal files analyzed: {stats['total_files']:,}\n")
+    w(f"Files skipped: {stats['skipped_files']:,}\n")
+    w(f"Errors encountered: {stats['errors']:,}\n")
     
-    print(f"\nTotal characters: {stats['total_chars']:,}")
-    print(f"Estimated tokens: {stats['total_tokens']:,}")
-    print(f"Token limit: {token_limit:,}")
+    w(f"\nTotal characters: {stats['total_chars']:,}\n")
+    w(f"Estimated tokens: {stats['total_tokens']:,}\n")
+    w(f"Token limit: {token_limit:,}\n")
     
     percentage = (stats['total_tokens'] / token_limit) * 100
-    print(f"\nUsage: {percentage:.1f}% of {token_limit:,} token limit")
+    w(f"\nUsage: {percentage:.1f}% of {token_limit:,} token limit\n")
     
-    if stats['total_tokens'] > token_limit:
-        print(f"⚠️  WARNING: Exceeds token limit by {stats['total_tokens'] - token_limit:,} tokens!")
+    if stats.get('partial_scan'):
+        w(f"⚠️  WARNING: Definitely exceeds token limit; partial scan of {stats['total_files']:,} files\n")
+    elif stats['total_tokens'] > token_limit:
+        w(f"⚠️  WARNING: Exceeds token limit by {stats['total_tokens'] - token_limit:,} tokens!\n")
     else:
-        print(f"✓ Fits within token limit with {token_limit - stats['total_tokens']:,} tokens to spare")
+        w(f"✓ Fits within token limit with {token_limit - stats['total_tokens']:,} tokens to spare\n")
     
     # File type breakdown
-    print("\n" + "-" * 80)
-    print("BREAKDOWN BY FILE TYPE")
-    print("-" * 80)
-    print(f"{'Extension':<12} {'Files':<8} {'Characters':<15} {'Est. Tokens':<15} {'% of Total'}")
-    print("-" * 80)
-    
-    sorted_extensions = sorted(
-        stats['by_extension'].items(),
-        key=lambda x: x[1]['tokens'],
-        reverse=True
-    )
+    w("\n" + "-" * 80 + "\n")
+    w("BREAKDOWN BY FILE TYPE\n")
+    w("-" * 80 + "\n")
+    w(f"{'Extension':<12} {'Files':<8} {'Characters':<15} {'Est. Tokens':<15} {'% of Total'}\n")
+    w("-" * 80 + "\n")
     
-    for ext, ext_stats in sorted_extensions[:15]:  # Top 15 extensions
-        percentage = (ext_stats['tokens'] / stats['total_tokens']) * 100 if stats['total_tokens'] > 0 else 0
-        print(f"{ext:<12} {ext_stats['files']:<8} {ext_stats['chars']:<15,} {ext_stats['tokens']:<15,} {percentage:>6.1f}%")
+    for ext, ext_tokens in stats['tokens_by_ext'].most_common(15):  # Top 15 extensions
+        percentage = (ext_tokens / stats['total_tokens']) * 100 if stats['total_tokens'] > 0 else 0
+        w(f"{ext:<12} {stats['files_by_ext'][ext]:<8} {stats['chars_by_ext'][ext]:<15,} {ext_tokens:<15,} {percentage:>6.1f}%\n")
     
     # Largest files
     if stats['largest_files']:
-        print("\n" + "-" * 80)
-        print("LARGEST FILES BY TOKEN COUNT")
-        print("-" * 80)
-        print(f"{'File Path':<50} {'Size':<10} {'Est. Tokens':<12} {'% of Total'}")
-        print("-" * 80)
+        w("\n" + "-" * 80 + "\n")
+        w("LARGEST FILES BY TOKEN COUNT\n")
+        w("-" * 80 + "\n")
+        w(f"{'File Path':<50} {'Size':<10} {'Est. Tokens':<12} {'% of Total'}\n")
+        w("-" * 80 + "\n")
         
-        for file_info in stats['largest_files'][:10]:  # Top 10 files
-            percentage = (file_info['tokens'] / stats['total_tokens']) * 100 if stats['total_tokens'] > 0 else 0
-            file_path = file_info['path']
+        largest_files = sorted(stats['largest_files'], reverse=True)
+        for tokens, file_size, file_path in largest_files[:10]:  # Top 10 files
+            percentage = (tokens / stats['total_tokens']) * 100 if stats['total_tokens'] > 0 else 0
             if len(file_path) > 47:
                 file_path = "..." + file_path[-44:]
-            print(f"{file_path:<50} {format_size(file_info['size']):<10} {file_info['tokens']:<12,} {percentage:>6.1f}%")
+            w(f"{file_path:<50} {format_size(file_size):<10} {tokens:<12,} {percentage:>6.1f}%\n")
+    
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
 
 def main():
     parser = argparse.ArgumentParser(
@@ -269,11 +493,60 @@ def main():
         default=10,
         help='Maximum file size in MB to process (default: 10)'
     )
+    parser.add_argument(
+        '--sample-mode',
+        choices=['size', 'sample', 'full'],
+        default='size',
+        help='How to count characters: file size, size scaled by a decoded '
+             'sample, or a full read of every file (default: size)'
+    )
+    parser.add_argument(
+        '--sample-bytes',
+        type=int,
+        default=4096,
+        help='Bytes to decode per file with --sample-mode sample (default: 4096)'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=(os.cpu_count() or 1) * 4,
+        help='Directories to scan concurrently; 1 scans serially '
+             '(default: 4x CPU count)'
+    )
+    parser.add_argument(
+        '--cache',
+        action='store_true',
+        help='With --sample-mode sample or full, reuse character counts from '
+             'a previous run for files whose size and mtime are unchanged'
+    )
+    parser.add_argument(
+        '--refresh-cache',
+        action='store_true',
+        help='Recount every file and overwrite the cached character counts'
+    )
+    parser.add_argument(
+        '--fail-fast',
+        action='store_true',
+        help=f'Stop scanning once the estimate exceeds {FAIL_FAST_FACTOR}x the '
+             'token limit and report partial results'
+    )
     
     args = parser.parse_args()
     
+    if (args.cache or args.refresh_cache) and args.sample_mode == 'size':
+        parser.error('--cache/--refresh-cache need --sample-mode sample or full')
+    
     # Analyze directory
-    stats = analyze_directory(args.directory, args.max_file_size)
+    stats = analyze_directory(
+        args.directory,
+        max_file_size_mb=args.max_file_size,
+        sample_mode=args.sample_mode,
+        sample_bytes=args.sample_bytes,
+        jobs=args.jobs,
+        use_cache=args.cache,
+        refresh_cache=args.refresh_cache,
+        stop_above_tokens=args.limit * FAIL_FAST_FACTOR if args.fail_fast else None
+    )
     
     # Print report
     if stats: